@@ -18,6 +18,8 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 
+from flask_apcore.serializers import annotations_to_dict
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -176,11 +178,7 @@ class RegistryWriter:
 
         func = _flatten_pydantic_params(_resolve_target(mod.target))
 
-        annotations_dict: dict[str, Any] | None = None
-        if mod.annotations is not None:
-            from dataclasses import asdict
-
-            annotations_dict = asdict(mod.annotations)
+        annotations_dict = annotations_to_dict(mod.annotations)
 
         metadata = {
             **(mod.metadata or {}),
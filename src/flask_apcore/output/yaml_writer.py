@@ -15,16 +15,34 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
 
+from flask_apcore.serializers import annotations_to_dict
+
 if TYPE_CHECKING:
     from flask_apcore.scanners.base import ScannedModule
 
+try:
+    from yaml import CSafeDumper as _BaseSafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _BaseSafeDumper
+
+
+class _BindingDumper(_BaseSafeDumper):
+    """Safe dumper that never emits anchors/aliases.
+
+    Binding files are meant to be edited by hand; an ``&id001`` anchor
+    would make editing one schema silently change another.
+    """
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
 logger = logging.getLogger("flask_apcore")
 
 
@@ -50,57 +68,64 @@ class YAMLWriter:
         if not modules:
             return []
 
+        results = [self._build_binding(module) for module in modules]
+        if dry_run:
+            return results
+
         output_path = Path(output_dir).resolve()
-        if not dry_run:
-            output_path.mkdir(parents=True, exist_ok=True)
+        output_path.mkdir(parents=True, exist_ok=True)
+        header = self._header()
+
+        for module, binding_data in zip(modules, results):
+            # Sanitize module_id for safe filename construction
+            safe_id = re.sub(r"[^a-zA-Z0-9._-]", "_", module.module_id)
+            # Collapse consecutive dots to prevent path traversal
+            safe_id = re.sub(r"\.{2,}", "_", safe_id)
+            filename = f"{safe_id}.binding.yaml"
+            file_path = (output_path / filename).resolve()
+
+            # Path traversal protection
+            if not str(file_path).startswith(str(output_path)):
+                logger.warning(
+                    "Skipping file outside output directory: %s",
+                    file_path,
+                )
+                continue
 
-        results: list[dict[str, Any]] = []
-        timestamp = datetime.now(timezone.utc).isoformat()
+            if file_path.exists():
+                logger.warning("Overwriting existing file: %s", file_path)
 
-        for module in modules:
-            binding_data = self._build_binding(module)
-            results.append(binding_data)
-
-            if not dry_run:
-                # Sanitize module_id for safe filename construction
-                safe_id = re.sub(r"[^a-zA-Z0-9._-]", "_", module.module_id)
-                # Collapse consecutive dots to prevent path traversal
-                safe_id = re.sub(r"\.{2,}", "_", safe_id)
-                filename = f"{safe_id}.binding.yaml"
-                file_path = (output_path / filename).resolve()
-
-                # Path traversal protection
-                if not str(file_path).startswith(str(output_path)):
-                    logger.warning(
-                        "Skipping file outside output directory: %s",
-                        file_path,
-                    )
-                    continue
-
-                if file_path.exists():
-                    logger.warning("Overwriting existing file: %s", file_path)
-
-                header = (
-                    f"# Auto-generated by flask-apcore scanner\n"
-                    f"# Generated: {timestamp}\n"
-                    "# Do not edit manually unless you intend"
-                    " to customize schemas.\n\n"
-                )
-                yaml_content = yaml.dump(binding_data, default_flow_style=False, sort_keys=False)
-                file_path.write_text(header + yaml_content, encoding="utf-8")
-                logger.debug("Written: %s", file_path)
+            self._dump(file_path, header, binding_data)
 
         return results
 
+    @staticmethod
+    def _header() -> str:
+        """Return the comment header written at the top of each file."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        return (
+            f"# Auto-generated by flask-apcore scanner\n"
+            f"# Generated: {timestamp}\n"
+            "# Do not edit manually unless you intend"
+            " to customize schemas.\n\n"
+        )
+
+    @staticmethod
+    def _dump(file_path: Path, header: str, data: dict[str, Any]) -> None:
+        """Serialize ``data`` as YAML and write it after ``header``.
+
+        The dumper encodes straight to UTF-8 bytes, which are written in
+        binary mode, bypassing the text I/O layer.
+        """
+        payload = yaml.dump(data, Dumper=_BindingDumper, default_flow_style=False, sort_keys=False, encoding="utf-8")
+        file_path.write_bytes(header.encode("utf-8") + payload)
+        logger.debug("Written: %s", file_path)
+
     def _build_binding(self, module: ScannedModule) -> dict[str, Any]:
         """Build the YAML-serializable dict for a ScannedModule.
 
         Includes annotations, documentation, and metadata fields.
         """
-        annotations_dict: dict[str, Any] | None = None
-        if module.annotations is not None:
-            annotations_dict = asdict(module.annotations)
-
         return {
             "bindings": [
                 {
@@ -110,7 +135,7 @@ class YAMLWriter:
                     "documentation": module.documentation,
                     "tags": module.tags,
                     "version": module.version,
-                    "annotations": annotations_dict,
+                    "annotations": annotations_to_dict(module.annotations),
                     "metadata": module.metadata,
                     "input_schema": module.input_schema,
                     "output_schema": module.output_schema,
@@ -11,12 +11,21 @@ Adapted from django-apcore's scanners/base.py:
 - annotations: ModuleAnnotations for behavioral hints (readonly, destructive, etc.)
 - documentation: Full docstring for rich MCP tool descriptions
 - metadata: Arbitrary key-value data for scanner-specific information
+
+Performance note for contributors: scanning is bound by attribute lookups
+and dict/regex probes over the route table, not by numeric work. Target
+Python-level dispatch (precompiled patterns, dict/set lookups, slots,
+shared immutable values) rather than SIMD, Numba, or other JIT/C-extension
+approaches, which have nothing to vectorize here.
 """
 
 from __future__ import annotations
 
+import functools
+import operator
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -27,10 +36,71 @@ if TYPE_CHECKING:
     from werkzeug.routing import Rule
 
 
-@dataclass
+# Endpoints Flask registers for static file serving: the app-level "static"
+# endpoint and each Blueprint's "{bp}.static".
+_STATIC_ENDPOINTS = frozenset({"static"})
+_STATIC_SUFFIX = ".static"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a filter regex, reusing the result across scans.
+
+    Compiled patterns are immutable, so sharing them between threads and
+    scanner instances is safe. Call ``_compile_pattern.cache_clear()`` to
+    reset the cache (e.g. in tests).
+    """
+    return re.compile(pattern)
+
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()")
+
+
+@functools.lru_cache(maxsize=256)
+def _literal_prefix(pattern: str) -> str | None:
+    """Return the literal text of an anchored ``^literal`` pattern, else None.
+
+    Backslash-escaped punctuation (``\\.``) counts as literal; escapes such
+    as ``\\d`` or any unescaped metacharacter make the pattern a real regex.
+    """
+    if not pattern.startswith("^"):
+        return None
+    chars: list[str] = []
+    it = iter(pattern[1:])
+    for ch in it:
+        if ch == "\\":
+            escaped = next(it, None)
+            if escaped is None or escaped.isalnum() or escaped == "_":
+                return None
+            chars.append(escaped)
+        elif ch in _REGEX_METACHARS:
+            return None
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def _id_matcher(pattern: str) -> Callable[[str], Any]:
+    """Return a callable whose result is truthy when a module_id matches.
+
+    Anchored literal prefixes (the common ``^blueprint\\.`` filter) are tested
+    with ``str.startswith``; anything else uses the compiled regex's
+    ``search``.
+    """
+    prefix = _literal_prefix(pattern)
+    if prefix is not None:
+        return operator.methodcaller("startswith", prefix)
+    return _compile_pattern(pattern).search
+
+
+@dataclass(slots=True, frozen=True)
 class ScannedModule:
     """Result of scanning a single Flask endpoint.
 
+    Slotted to keep instances compact; scans of large apps produce one
+    instance per route and method. Frozen so instances can be shared
+    safely; use ``dataclasses.replace`` to derive a modified copy.
+
     Attributes:
         module_id: Unique module identifier (e.g., 'users.get_user.get').
         description: Human-readable description for MCP tool listing.
@@ -66,8 +136,8 @@ class BaseScanner(ABC):
     """Abstract base class for all Flask scanners.
 
     Subclasses must implement scan() and get_source_name().
-    Utility methods filter_modules(), _deduplicate_ids(), and
-    _is_api_route() are provided for common scanner operations.
+    Utility methods filter_modules(), _make_id_filter(), _deduplicate_ids(),
+    and _is_api_route() are provided for common scanner operations.
     """
 
     @abstractmethod
@@ -96,31 +166,58 @@ class BaseScanner(ABC):
 
     def filter_modules(
         self,
-        modules: list[ScannedModule],
+        modules: Iterable[ScannedModule],
         include: str | None = None,
         exclude: str | None = None,
     ) -> list[ScannedModule]:
         """Apply include/exclude regex filters to scanned modules.
 
+        ``modules`` may be any iterable, including a generator, so callers
+        producing modules lazily never need an unfiltered intermediate list.
+
         Args:
-            modules: List of ScannedModule instances to filter.
+            modules: ScannedModule instances to filter.
             include: If set, only modules whose module_id matches are kept.
             exclude: If set, modules whose module_id matches are removed.
 
         Returns:
             Filtered list of ScannedModule instances.
         """
-        result = modules
+        keep = self._make_id_filter(include, exclude)
+        if keep is None:
+            return modules if isinstance(modules, list) else list(modules)
+        return [m for m in modules if keep(m.module_id)]
 
-        if include is not None:
-            pattern = re.compile(include)
-            result = [m for m in result if pattern.search(m.module_id)]
+    @staticmethod
+    def _make_id_filter(
+        include: str | None = None,
+        exclude: str | None = None,
+    ) -> Callable[[str], bool] | None:
+        """Build a predicate applying include/exclude regexes to a module_id.
 
-        if exclude is not None:
-            pattern = re.compile(exclude)
-            result = [m for m in result if not pattern.search(m.module_id)]
+        Scanners can use this to discard routes by ID before doing any
+        expensive per-route work such as schema inference.
 
-        return result
+        Args:
+            include: If set, only IDs matching this pattern are kept.
+            exclude: If set, IDs matching this pattern are rejected.
+
+        Returns:
+            A callable returning True for IDs to keep, or None when neither
+            pattern is set.
+        """
+        if include is None and exclude is None:
+            return None
+
+        # Bind the matchers to locals so the per-ID test is a plain call with
+        # no attribute lookups.
+        inc_match = _id_matcher(include) if include is not None else None
+        exc_match = _id_matcher(exclude) if exclude is not None else None
+
+        def keep(module_id: str) -> bool:
+            return (inc_match is None or bool(inc_match(module_id))) and (exc_match is None or not exc_match(module_id))
+
+        return keep
 
     def _deduplicate_ids(self, modules: list[ScannedModule]) -> list[ScannedModule]:
         """Resolve duplicate module IDs by appending _2, _3, etc.
@@ -129,16 +226,40 @@ class BaseScanner(ABC):
         this operates on ScannedModule instances directly,
         producing new instances with updated module_id via dataclass replace.
         """
-        seen: dict[str, int] = {}
-        result: list[ScannedModule] = []
-        for module in modules:
-            mid = module.module_id
-            if mid in seen:
-                seen[mid] += 1
-                result.append(replace(module, module_id=f"{mid}_{seen[mid]}"))
-            else:
-                seen[mid] = 1
-                result.append(module)
+        unique_ids = self._deduplicate_id_strings([m.module_id for m in modules])
+        return [
+            module if module.module_id == mid else replace(module, module_id=mid)
+            for module, mid in zip(modules, unique_ids)
+        ]
+
+    @staticmethod
+    def _deduplicate_id_strings(module_ids: list[str]) -> list[str]:
+        """Resolve duplicate IDs in a list of strings by appending _2, _3, etc.
+
+        Every emitted ID is recorded in the counter, so a generated suffix
+        that collides with an existing ID (e.g. a real ``a_2`` endpoint) is
+        skipped by probing the next suffix. Runs in amortized O(n).
+
+        Args:
+            module_ids: Candidate IDs in scan order.
+
+        Returns:
+            IDs in the same order, each unique.
+        """
+        counts: dict[str, int] = {}
+        result: list[str] = []
+        for mid in module_ids:
+            n = counts.get(mid, 0) + 1
+            counts[mid] = n
+            if n > 1:
+                new_id = f"{mid}_{n}"
+                while new_id in counts:
+                    n += 1
+                    new_id = f"{mid}_{n}"
+                counts[mid] = n
+                counts[new_id] = 1
+                mid = new_id
+            result.append(mid)
         return result
 
     def _is_api_route(self, rule: Rule, view_func: Callable) -> bool:
@@ -156,6 +277,5 @@ class BaseScanner(ABC):
         Returns:
             True if the route appears to be an API endpoint.
         """
-        if rule.endpoint == "static" or rule.endpoint.endswith(".static"):
-            return False
-        return True
+        endpoint = rule.endpoint
+        return not (endpoint in _STATIC_ENDPOINTS or endpoint.endswith(_STATIC_SUFFIX))
@@ -36,7 +36,7 @@ logger = logging.getLogger("flask_apcore")
 
 # Flask URL converter class name to url_params shorthand type mapping.
 # The shorthand types ("int", "float", etc.) are resolved to JSON Schema
-# by the schema backends via their _FLASK_TYPE_MAP.
+# by the schema backends via schemas._constants.FLASK_TYPE_MAP.
 _CONVERTER_TYPE_MAP: dict[str, str] = {
     "IntegerConverter": "int",
     "FloatConverter": "float",
@@ -44,6 +44,34 @@ _CONVERTER_TYPE_MAP: dict[str, str] = {
     "PathConverter": "path",
 }
 
+# Methods Flask adds implicitly; they never become modules.
+_SKIPPED_METHODS = frozenset({"HEAD", "OPTIONS"})
+
+# Behavioral annotations depend only on the HTTP method, so one shared
+# instance per method is enough (ModuleAnnotations is frozen).
+_ANNOTATIONS_BY_METHOD: dict[str, ModuleAnnotations] = {
+    "GET": ModuleAnnotations(readonly=True),
+    "DELETE": ModuleAnnotations(destructive=True),
+    "PUT": ModuleAnnotations(idempotent=True),
+}
+_DEFAULT_ANNOTATIONS = ModuleAnnotations()
+
+
+def _extract_doc(func: Callable) -> tuple[str | None, str | None]:
+    """Return a view function's (first docstring line, full docstring).
+
+    Args:
+        func: The view function callable.
+
+    Returns:
+        Tuple of (description, documentation), both None without a docstring.
+    """
+    doc = inspect.getdoc(func)
+    if not doc:
+        return None, None
+    first, _, _ = doc.partition("\n")
+    return first.strip(), doc.strip()
+
 
 class NativeFlaskScanner(BaseScanner):
     """Scans native Flask routes via app.url_map and app.view_functions.
@@ -54,6 +82,9 @@ class NativeFlaskScanner(BaseScanner):
 
     def __init__(self) -> None:
         self._schema_dispatcher = SchemaDispatcher()
+        # Cleaned docstrings per view function. Held by the scanner (not the
+        # module) so view functions and their closures die with it.
+        self._doc_cache: dict[Callable, tuple[str | None, str | None]] = {}
 
     def scan(
         self,
@@ -63,7 +94,12 @@ class NativeFlaskScanner(BaseScanner):
     ) -> list[ScannedModule]:
         """Scan all Flask routes and generate module definitions.
 
-        For each route:
+        Candidate module IDs are computed (and deduplicated) for every route
+        first; include/exclude filters are applied to those IDs before any
+        schema inference or docstring work, so excluded routes cost only an
+        ID computation.
+
+        For each surviving route:
         1. Skip static file routes and template-rendering routes
         2. Extract URL path parameters with types from converters
         3. Infer input_schema via SchemaDispatcher
@@ -80,61 +116,87 @@ class NativeFlaskScanner(BaseScanner):
         Returns:
             List of ScannedModule instances.
         """
-        modules: list[ScannedModule] = []
+        candidates: list[tuple[Rule, Callable, str]] = []
+
+        # Bind hot lookups to locals; these loops run once per rule/method.
+        get_view_func = app.view_functions.get
+        is_api_route = self._is_api_route
+        add_candidate = candidates.append
 
         for rule in app.url_map.iter_rules():
-            if rule.endpoint == "static":
+            endpoint = rule.endpoint
+            if endpoint == "static":
                 continue
 
-            view_func = app.view_functions.get(rule.endpoint)
+            view_func = get_view_func(endpoint)
             if view_func is None:
                 continue
 
-            if not self._is_api_route(rule, view_func):
+            if not is_api_route(rule, view_func):
                 continue
 
             # Filter methods: skip HEAD, OPTIONS
-            methods = rule.methods - {"HEAD", "OPTIONS"}
+            methods = rule.methods - _SKIPPED_METHODS
             if not methods:
                 continue
 
-            # Extract URL path parameters
-            url_params = self._extract_url_params(rule)
-
             for method in sorted(methods):
-                module_id = self._generate_module_id(rule, view_func, method)
-                description = self._extract_description(view_func, rule, method)
-                documentation = self._extract_documentation(view_func)
-                annotations = self._infer_annotations(method)
-                target = self._generate_target(view_func)
-                tags = self._extract_tags(rule)
-
-                input_schema = self._schema_dispatcher.infer_input_schema(view_func, url_params=url_params)
-                output_schema = self._schema_dispatcher.infer_output_schema(view_func)
-
-                warnings: list[str] = []
-                if not input_schema.get("properties"):
-                    warnings.append(f"Route '{method} {rule.rule}' has no type hints " f"(input_schema is empty)")
-
-                modules.append(
-                    ScannedModule(
-                        module_id=module_id,
-                        description=description,
-                        input_schema=input_schema,
-                        output_schema=output_schema,
-                        tags=tags,
-                        target=target,
-                        http_method=method,
-                        url_rule=rule.rule,
-                        annotations=annotations,
-                        documentation=documentation,
-                        metadata={"source": "native"},
-                        warnings=warnings,
-                    )
+                add_candidate((rule, view_func, method))
+
+        generate_module_id = self._generate_module_id
+        module_ids = self._deduplicate_id_strings(
+            [generate_module_id(rule, view_func, method) for rule, view_func, method in candidates]
+        )
+        keep = self._make_id_filter(include, exclude)
+
+        modules: list[ScannedModule] = []
+        # Keyed by id(): Rule defines __eq__ without __hash__, and every rule
+        # stays referenced by app.url_map for the duration of the scan.
+        url_params_by_rule: dict[int, dict[str, str]] = {}
+        infer_input_schema = self._schema_dispatcher.infer_input_schema
+        infer_output_schema = self._schema_dispatcher.infer_output_schema
+        add_module = modules.append
+
+        for (rule, view_func, method), module_id in zip(candidates, module_ids):
+            if keep is not None and not keep(module_id):
+                continue
+
+            # Extract URL path parameters (once per rule, shared across methods)
+            url_params = url_params_by_rule.get(id(rule))
+            if url_params is None:
+                url_params = url_params_by_rule[id(rule)] = self._extract_url_params(rule)
+
+            description = self._extract_description(view_func, rule, method)
+            documentation = self._extract_documentation(view_func)
+            annotations = self._infer_annotations(method)
+            target = self._generate_target(view_func)
+            tags = self._extract_tags(rule)
+
+            input_schema = infer_input_schema(view_func, url_params=url_params)
+            output_schema = infer_output_schema(view_func)
+
+            warnings: list[str] = []
+            if not input_schema.get("properties"):
+                warnings.append(f"Route '{method} {rule.rule}' has no type hints " f"(input_schema is empty)")
+
+            add_module(
+                ScannedModule(
+                    module_id=module_id,
+                    description=description,
+                    input_schema=input_schema,
+                    output_schema=output_schema,
+                    tags=tags,
+                    target=target,
+                    http_method=method,
+                    url_rule=rule.rule,
+                    annotations=annotations,
+                    documentation=documentation,
+                    metadata={"source": "native"},
+                    warnings=warnings,
                 )
+            )
 
-        modules = self._deduplicate_ids(modules)
-        return self.filter_modules(modules, include, exclude)
+        return modules
 
     def get_source_name(self) -> str:
         """Return human-readable scanner name."""
@@ -153,15 +215,9 @@ class NativeFlaskScanner(BaseScanner):
             method: HTTP method string (uppercase).
 
         Returns:
-            ModuleAnnotations instance with inferred flags.
+            Shared (frozen) ModuleAnnotations instance with inferred flags.
         """
-        if method == "GET":
-            return ModuleAnnotations(readonly=True)
-        elif method == "DELETE":
-            return ModuleAnnotations(destructive=True)
-        elif method == "PUT":
-            return ModuleAnnotations(idempotent=True)
-        return ModuleAnnotations()
+        return _ANNOTATIONS_BY_METHOD.get(method, _DEFAULT_ANNOTATIONS)
 
     def _extract_url_params(self, rule: Rule) -> dict[str, str]:
         """Extract URL path parameters with their Flask converter types.
@@ -226,9 +282,9 @@ class NativeFlaskScanner(BaseScanner):
         Returns:
             Description string.
         """
-        doc = inspect.getdoc(view_func)
-        if doc:
-            return doc.split("\n")[0].strip()
+        description, _ = self._get_doc(view_func)
+        if description is not None:
+            return description
         return f"{method} {rule.rule}"
 
     def _extract_documentation(self, view_func: Callable) -> str | None:
@@ -240,10 +296,25 @@ class NativeFlaskScanner(BaseScanner):
         Returns:
             Full cleaned docstring, or None if no docstring.
         """
-        doc = inspect.getdoc(view_func)
-        if doc:
-            return doc.strip()
-        return None
+        return self._get_doc(view_func)[1]
+
+    def _get_doc(self, view_func: Callable) -> tuple[str | None, str | None]:
+        """Return _extract_doc(view_func), cached on this scanner.
+
+        Args:
+            view_func: The view function callable.
+
+        Returns:
+            Tuple of (description, documentation).
+        """
+        try:
+            doc = self._doc_cache.get(view_func)
+        except TypeError:
+            # Unhashable view callable: extract without caching.
+            return _extract_doc(view_func)
+        if doc is None:
+            doc = self._doc_cache[view_func] = _extract_doc(view_func)
+        return doc
 
     def _generate_target(self, view_func: Callable) -> str:
         """Generate target in 'module.path:callable' format.
@@ -267,7 +338,5 @@ class NativeFlaskScanner(BaseScanner):
         Returns:
             List of tag strings (Blueprint name if applicable).
         """
-        parts = rule.endpoint.split(".")
-        if len(parts) > 1:
-            return [parts[0]]
-        return []
+        blueprint_name, sep, _ = rule.endpoint.partition(".")
+        return [blueprint_name] if sep else []
@@ -12,6 +12,7 @@ From tech design sections 9.1--9.4:
 
 from __future__ import annotations
 
+import copy
 import logging
 from typing import Any, Callable, Protocol, runtime_checkable
 
@@ -37,6 +38,11 @@ class SchemaBackend(Protocol):
     def infer_output(self, func: Callable, context: dict | None = None) -> dict[str, Any]: ...
 
 
+# Marks a function whose backend has not been chosen yet; None is a valid
+# memoized answer (no backend matched).
+_UNRESOLVED: Any = object()
+
+
 class SchemaDispatcher:
     """Routes schema inference to the best available backend.
 
@@ -47,11 +53,49 @@ class SchemaDispatcher:
     4. Fallback: empty schema
 
     Detection precedence for output_schema follows the same order.
+
+    Results are memoized per dispatcher, keyed by the function object (and
+    URL parameters for input schemas), so repeated scans of the same views
+    skip the backend chain. Calls with extra_context bypass the cache since
+    that context is caller-supplied and not hashable; unhashable view
+    callables (e.g. callable dataclass instances) bypass it too. Every call
+    returns its own deep copy of the cached schema, so callers (and the
+    modules built from them, e.g. GET and POST on one view) never share
+    schema objects.
+
+    The backend chosen for each function is remembered separately, so a view
+    registered under several URL rules (different url_params) only runs the
+    can_handle_* probes once.
+
+    The backend order is semantic, not a performance heuristic: backends
+    overlap (a Pydantic-typed view also satisfies the type-hints backend), so
+    the list must never be reordered by hit frequency. The per-function
+    selection cache above is what removes repeated probes.
     """
 
     def __init__(self) -> None:
-        self._backends: list[SchemaBackend] = []
-        self._register_available_backends()
+        # Filled on first access to _backends, so constructing a dispatcher
+        # does not import the optional marshmallow backend.
+        self._backend_list: list[SchemaBackend] | None = None
+        self._input_cache: dict[tuple[Callable, tuple[tuple[str, str], ...] | None], dict[str, Any]] = {}
+        self._output_cache: dict[Callable, dict[str, Any]] = {}
+        self._input_backend_for: dict[Callable, SchemaBackend | None] = {}
+        self._output_backend_for: dict[Callable, SchemaBackend | None] = {}
+
+    @property
+    def _backends(self) -> list[SchemaBackend]:
+        """Registered backends in priority order, created on first access."""
+        if self._backend_list is None:
+            self._backend_list = []
+            self._register_available_backends()
+        return self._backend_list
+
+    def clear_cache(self) -> None:
+        """Discard all memoized schemas and backend selections."""
+        self._input_cache.clear()
+        self._output_cache.clear()
+        self._input_backend_for.clear()
+        self._output_backend_for.clear()
 
     def _register_available_backends(self) -> None:
         """Register backends based on available imports.
@@ -94,15 +138,48 @@ class SchemaDispatcher:
         Returns:
             JSON Schema dict for the function's input.
         """
-        for backend in self._backends:
-            if backend.can_handle_input(func, context=extra_context):
-                backend_name = type(backend).__name__
-                logger.debug(
-                    "Schema input inference: selected %s for %s",
-                    backend_name,
-                    getattr(func, "__name__", repr(func)),
-                )
-                return backend.infer_input(func, url_params=url_params, context=extra_context)
+        if extra_context is not None:
+            return self._infer_input_uncached(func, url_params, extra_context)
+
+        key = (func, tuple(sorted(url_params.items())) if url_params else None)
+        try:
+            schema = self._input_cache.get(key)
+        except TypeError:
+            # Unhashable view callable (e.g. a dataclass instance): skip the cache.
+            return self._infer_input_uncached(func, url_params, None)
+        if schema is None:
+            schema = self._input_cache[key] = self._infer_input_uncached(func, url_params, None)
+        return copy.deepcopy(schema)
+
+    def _infer_input_uncached(
+        self,
+        func: Callable,
+        url_params: dict[str, str] | None,
+        extra_context: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Run the input backend chain without consulting the schema cache."""
+        memoize = extra_context is None
+        backend = _UNRESOLVED
+        if memoize:
+            try:
+                backend = self._input_backend_for.get(func, _UNRESOLVED)
+            except TypeError:
+                memoize = False
+        if backend is _UNRESOLVED:
+            backend = next(
+                (b for b in self._backends if b.can_handle_input(func, context=extra_context)),
+                None,
+            )
+            if memoize:
+                self._input_backend_for[func] = backend
+
+        if backend is not None:
+            logger.debug(
+                "Schema input inference: selected %s for %s",
+                type(backend).__name__,
+                getattr(func, "__name__", repr(func)),
+            )
+            return backend.infer_input(func, url_params=url_params, context=extra_context)
 
         # Fallback: empty schema
         logger.debug(
@@ -125,15 +202,46 @@ class SchemaDispatcher:
         Returns:
             JSON Schema dict for the function's output.
         """
-        for backend in self._backends:
-            if backend.can_handle_output(func, context=extra_context):
-                backend_name = type(backend).__name__
-                logger.debug(
-                    "Schema output inference: selected %s for %s",
-                    backend_name,
-                    getattr(func, "__name__", repr(func)),
-                )
-                return backend.infer_output(func, context=extra_context)
+        if extra_context is not None:
+            return self._infer_output_uncached(func, extra_context)
+
+        try:
+            schema = self._output_cache.get(func)
+        except TypeError:
+            # Unhashable view callable (e.g. a dataclass instance): skip the cache.
+            return self._infer_output_uncached(func, None)
+        if schema is None:
+            schema = self._output_cache[func] = self._infer_output_uncached(func, None)
+        return copy.deepcopy(schema)
+
+    def _infer_output_uncached(
+        self,
+        func: Callable,
+        extra_context: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Run the output backend chain without consulting the schema cache."""
+        memoize = extra_context is None
+        backend = _UNRESOLVED
+        if memoize:
+            try:
+                backend = self._output_backend_for.get(func, _UNRESOLVED)
+            except TypeError:
+                memoize = False
+        if backend is _UNRESOLVED:
+            backend = next(
+                (b for b in self._backends if b.can_handle_output(func, context=extra_context)),
+                None,
+            )
+            if memoize:
+                self._output_backend_for[func] = backend
+
+        if backend is not None:
+            logger.debug(
+                "Schema output inference: selected %s for %s",
+                type(backend).__name__,
+                getattr(func, "__name__", repr(func)),
+            )
+            return backend.infer_output(func, context=extra_context)
 
         # Fallback: permissive schema
         logger.debug(
@@ -13,3 +13,40 @@ FLASK_TYPE_MAP: dict[str, dict[str, Any]] = {
     "uuid": {"type": "string", "format": "uuid"},
     "path": {"type": "string"},
 }
+
+_DEFAULT_URL_PARAM_SCHEMA: dict[str, Any] = {"type": "string"}
+
+
+def url_param_schema(param_type: str) -> dict[str, Any]:
+    """Return the JSON Schema for a URL parameter's converter type.
+
+    Unknown converter types map to a plain string schema. The result is a
+    fresh copy so callers may extend it without touching the shared table.
+
+    Args:
+        param_type: Converter shorthand (e.g. "int", "uuid").
+
+    Returns:
+        JSON Schema dict for the parameter.
+    """
+    return FLASK_TYPE_MAP.get(param_type, _DEFAULT_URL_PARAM_SCHEMA).copy()
+
+
+def merge_url_params(properties: dict[str, Any], required: list[str], url_params: dict[str, str]) -> None:
+    """Add URL parameters to a schema's ``properties`` and ``required`` in place.
+
+    Each parameter overrides any same-named property and is appended to
+    ``required`` unless already listed. Membership is checked against a
+    set, so merging stays linear in the number of parameters.
+
+    Args:
+        properties: The schema's ``properties`` dict.
+        required: The schema's ``required`` list.
+        url_params: URL path parameters with their Flask converter types.
+    """
+    seen = set(required)
+    for param_name, param_type in url_params.items():
+        properties[param_name] = url_param_schema(param_type)
+        if param_name not in seen:
+            required.append(param_name)
+            seen.add(param_name)
@@ -0,0 +1,34 @@
+"""Cached function introspection shared by schema backends."""
+
+from __future__ import annotations
+
+import typing
+import weakref
+from typing import Any, Callable
+
+# Weakly keyed so view functions (and their closures) are not kept alive
+# after the app that registered them is gone.
+_hints_cache: weakref.WeakKeyDictionary[Callable, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def type_hints(func: Callable) -> dict[str, Any]:
+    """Return ``typing.get_type_hints(func, include_extras=True)``, cached per function.
+
+    Each backend probes the same view function several times (can_handle_*
+    and infer_*), and resolving string annotations is comparatively slow.
+    The returned dict is shared and must not be mutated.
+
+    Args:
+        func: The callable to inspect.
+
+    Returns:
+        Mapping of parameter names (and ``"return"``) to resolved types.
+    """
+    try:
+        hints = _hints_cache.get(func)
+    except TypeError:
+        # Unhashable or not weak-referenceable callable: resolve without caching.
+        return typing.get_type_hints(func, include_extras=True)
+    if hints is None:
+        hints = _hints_cache[func] = typing.get_type_hints(func, include_extras=True)
+    return hints
@@ -22,14 +22,25 @@ marshmallow is an optional dependency; import errors are handled gracefully.
 
 from __future__ import annotations
 
+import copy
 import logging
+import weakref
 from typing import Any, Callable
 
-from flask_apcore.schemas._constants import FLASK_TYPE_MAP
+from flask_apcore.schemas._constants import merge_url_params
 
 logger = logging.getLogger("flask_apcore")
 
 
+def _constant_schema(template: dict[str, Any]) -> Callable[[Any], dict[str, Any]]:
+    """Return a field handler producing a fresh copy of ``template``."""
+
+    def build(field_obj: Any) -> dict[str, Any]:
+        return dict(template)
+
+    return build
+
+
 class MarshmallowBackend:
     """Converts marshmallow Schema to JSON Schema.
 
@@ -38,8 +49,37 @@ class MarshmallowBackend:
     manually by the SchemaDispatcher).
 
     Priority: second (after Pydantic) in the dispatcher chain.
+
+    Converted schemas are cached per Schema class or instance (weakly, so
+    discarded schemas are not kept alive). Schema definitions are fixed
+    once created, so conversion runs once per schema object.
     """
 
+    def __init__(self) -> None:
+        from marshmallow import fields, validate
+
+        self._length_validator = validate.Length
+        self._range_validator = validate.Range
+        self._json_schema_cache: weakref.WeakKeyDictionary[Any, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+        # Field class -> JSON Schema builder. Looked up by exact class first;
+        # subclasses resolve through their MRO (most specific match wins) and
+        # are then memoized here.
+        self._field_handlers: dict[type, Callable[[Any], dict[str, Any]]] = {
+            fields.Email: _constant_schema({"type": "string", "format": "email"}),
+            fields.UUID: _constant_schema({"type": "string", "format": "uuid"}),
+            fields.DateTime: _constant_schema({"type": "string", "format": "date-time"}),
+            fields.Date: _constant_schema({"type": "string", "format": "date"}),
+            fields.String: _constant_schema({"type": "string"}),
+            fields.Integer: _constant_schema({"type": "integer"}),
+            fields.Float: _constant_schema({"type": "number"}),
+            fields.Boolean: _constant_schema({"type": "boolean"}),
+            fields.List: self._list_field_schema,
+            fields.Nested: self._nested_field_schema,
+        }
+        if hasattr(fields, "Enum"):
+            self._field_handlers[fields.Enum] = self._enum_field_schema
+
     def can_handle_input(self, func: Callable[..., Any], context: dict[str, Any] | None = None) -> bool:
         """Return True if context contains a marshmallow input schema."""
         return context is not None and "marshmallow_input" in context
@@ -61,15 +101,10 @@ class MarshmallowBackend:
             JSON Schema dict.
         """
         schema_instance = context["marshmallow_input"]  # type: ignore[index]
-        result = self._schema_to_json_schema(schema_instance)
-
-        # Merge URL params
+        # Deep copy: the cached conversion is shared by every later call.
+        result = copy.deepcopy(self._schema_to_json_schema(schema_instance))
         if url_params:
-            for param_name, param_type in url_params.items():
-                result["properties"][param_name] = FLASK_TYPE_MAP.get(param_type, {"type": "string"})
-                if param_name not in result.get("required", []):
-                    result.setdefault("required", []).append(param_name)
-
+            merge_url_params(result["properties"], result["required"], url_params)
         return result
 
     def can_handle_output(self, func: Callable[..., Any], context: dict[str, Any] | None = None) -> bool:
@@ -83,9 +118,24 @@ class MarshmallowBackend:
     ) -> dict[str, Any]:
         """Convert marshmallow output Schema to JSON Schema."""
         schema_instance = context["marshmallow_output"]  # type: ignore[index]
-        return self._schema_to_json_schema(schema_instance)
+        return copy.deepcopy(self._schema_to_json_schema(schema_instance))
 
     def _schema_to_json_schema(self, schema_instance: Any) -> dict[str, Any]:
+        """Return the cached JSON Schema for a marshmallow Schema class or instance.
+
+        The returned dict is the cache entry itself; public methods hand out
+        deep copies of it.
+        """
+        try:
+            cached = self._json_schema_cache.get(schema_instance)
+        except TypeError:
+            # Not weak-referenceable/hashable: convert without caching.
+            return self._build_json_schema(schema_instance)
+        if cached is None:
+            cached = self._json_schema_cache[schema_instance] = self._build_json_schema(schema_instance)
+        return cached
+
+    def _build_json_schema(self, schema_instance: Any) -> dict[str, Any]:
         """Convert a marshmallow Schema instance to JSON Schema dict.
 
         Handles both Schema classes and Schema instances. If a class is
@@ -115,52 +165,50 @@ class MarshmallowBackend:
         Handles: Email, String, Integer, Float, Boolean, List, Nested,
                  DateTime, Date, UUID, Enum.
 
-        Note: isinstance checks are ordered so that subclasses are tested
-        before their parents (e.g., Email before String, since Email
-        inherits from String).
+        The builder is chosen by a dict lookup on the field's class. For
+        subclasses the MRO is walked, so the most specific mapped class wins
+        (e.g., Email over String, since Email inherits from String).
         """
-        from marshmallow import fields
-
-        schema: dict[str, Any] = {}
-
-        # Email must come before String (Email is a subclass of String)
-        if isinstance(field_obj, fields.Email):
-            schema = {"type": "string", "format": "email"}
-        elif isinstance(field_obj, fields.UUID):
-            schema = {"type": "string", "format": "uuid"}
-        elif isinstance(field_obj, fields.DateTime):
-            schema = {"type": "string", "format": "date-time"}
-        elif isinstance(field_obj, fields.Date):
-            schema = {"type": "string", "format": "date"}
-        elif isinstance(field_obj, fields.String):
-            schema = {"type": "string"}
-        elif isinstance(field_obj, fields.Integer):
-            schema = {"type": "integer"}
-        elif isinstance(field_obj, fields.Float):
-            schema = {"type": "number"}
-        elif isinstance(field_obj, fields.Boolean):
-            schema = {"type": "boolean"}
-        elif isinstance(field_obj, fields.List):
-            inner = self._marshmallow_field_to_json_schema(field_obj.inner)
-            schema = {"type": "array", "items": inner}
-        elif isinstance(field_obj, fields.Nested):
-            nested_schema = field_obj.nested
-            schema = self._schema_to_json_schema(nested_schema)
-        elif hasattr(fields, "Enum") and isinstance(field_obj, fields.Enum):
-            enum_values = [e.value for e in field_obj.enum]
-            schema = {"type": "string", "enum": enum_values}
-        else:
+        handler = self._resolve_field_handler(type(field_obj))
+        if handler is None:
             logger.warning(
                 "Unknown marshmallow field type: %s, defaulting to string",
                 type(field_obj),
             )
-            schema = {"type": "string"}
+            schema: dict[str, Any] = {"type": "string"}
+        else:
+            schema = handler(field_obj)
 
         # Extract validation constraints
         self._apply_validators(field_obj, schema)
 
         return schema
 
+    def _resolve_field_handler(self, field_cls: type) -> Callable[[Any], dict[str, Any]] | None:
+        """Return the schema builder for a field class, or None if unmapped."""
+        handler = self._field_handlers.get(field_cls)
+        if handler is not None:
+            return handler
+        for base in field_cls.__mro__[1:]:
+            handler = self._field_handlers.get(base)
+            if handler is not None:
+                self._field_handlers[field_cls] = handler
+                return handler
+        return None
+
+    def _list_field_schema(self, field_obj: Any) -> dict[str, Any]:
+        """Build an array schema from a List field's inner field."""
+        return {"type": "array", "items": self._marshmallow_field_to_json_schema(field_obj.inner)}
+
+    def _nested_field_schema(self, field_obj: Any) -> dict[str, Any]:
+        """Build an object schema from a Nested field's schema."""
+        # Copy: validators may add keys to this field's schema.
+        return dict(self._schema_to_json_schema(field_obj.nested))
+
+    def _enum_field_schema(self, field_obj: Any) -> dict[str, Any]:
+        """Build a string enum schema from an Enum field."""
+        return {"type": "string", "enum": [e.value for e in field_obj.enum]}
+
     def _apply_validators(self, field_obj: Any, schema: dict[str, Any]) -> None:
         """Extract marshmallow validators and add to JSON Schema.
 
@@ -168,15 +216,17 @@ class MarshmallowBackend:
         - validate.Length -> minLength / maxLength
         - validate.Range -> minimum / maximum
         """
-        from marshmallow import validate
+        validators = field_obj.validators
+        if not validators:
+            return
 
-        for validator in field_obj.validators:
-            if isinstance(validator, validate.Length):
+        for validator in validators:
+            if isinstance(validator, self._length_validator):
                 if validator.min is not None:
                     schema["minLength"] = validator.min
                 if validator.max is not None:
                     schema["maxLength"] = validator.max
-            elif isinstance(validator, validate.Range):
+            elif isinstance(validator, self._range_validator):
                 if validator.min is not None:
                     schema["minimum"] = validator.min
                 if validator.max is not None:
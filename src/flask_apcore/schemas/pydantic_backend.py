@@ -13,14 +13,16 @@ From tech design section 9.3.1:
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import types
-import typing
 from typing import Any, Callable, Union, get_args, get_origin
 
 from pydantic import BaseModel
 
-from flask_apcore.schemas._constants import FLASK_TYPE_MAP
+from flask_apcore.schemas._constants import merge_url_params
+from flask_apcore.schemas._introspection import type_hints
 
 logger = logging.getLogger("flask_apcore")
 
@@ -28,6 +30,22 @@ logger = logging.getLogger("flask_apcore")
 _SKIP_NAMES = frozenset({"self", "cls", "return"})
 
 
+@functools.lru_cache(maxsize=512)
+def _model_json_schema(model_cls: type[BaseModel]) -> dict[str, Any]:
+    """Return ``model_cls.model_json_schema()``, generated once per model.
+
+    Pydantic rebuilds the JSON Schema on every call; models are immutable
+    class definitions, so the result is cached. The cached dict is private:
+    use _model_schema_copy() to get one that callers may own.
+    """
+    return model_cls.model_json_schema()
+
+
+def _model_schema_copy(model_cls: type[BaseModel]) -> dict[str, Any]:
+    """Return a deep copy of the cached JSON Schema for model_cls."""
+    return copy.deepcopy(_model_json_schema(model_cls))
+
+
 def _extract_pydantic_model(hint: Any) -> type[BaseModel] | None:
     """Extract a Pydantic BaseModel class from a type hint.
 
@@ -74,7 +92,7 @@ class PydanticBackend:
         and list[Model] wrapper types. Ignores ``self``, ``cls``, and
         ``return`` entries in the type hints.
         """
-        hints = typing.get_type_hints(func, include_extras=True)
+        hints = type_hints(func)
         return any(_extract_pydantic_model(hint) is not None for name, hint in hints.items() if name not in _SKIP_NAMES)
 
     def infer_input(
@@ -97,7 +115,7 @@ class PydanticBackend:
         Returns:
             JSON Schema dict for the function's input.
         """
-        hints = typing.get_type_hints(func, include_extras=True)
+        hints = type_hints(func)
         schema: dict[str, Any] = {
             "type": "object",
             "properties": {},
@@ -110,16 +128,13 @@ class PydanticBackend:
 
             model_cls = _extract_pydantic_model(hint)
             if model_cls is not None:
-                model_schema = model_cls.model_json_schema()
+                model_schema = _model_schema_copy(model_cls)
                 schema["properties"].update(model_schema.get("properties", {}))
                 schema["required"].extend(model_schema.get("required", []))
 
         # Add URL parameters
         if url_params:
-            for param_name, param_type in url_params.items():
-                schema["properties"][param_name] = FLASK_TYPE_MAP.get(param_type, {"type": "string"})
-                if param_name not in schema["required"]:
-                    schema["required"].append(param_name)
+            merge_url_params(schema["properties"], schema["required"], url_params)
 
         return schema
 
@@ -128,7 +143,7 @@ class PydanticBackend:
 
         Also handles Optional[Model] and list[Model] return types.
         """
-        hints = typing.get_type_hints(func, include_extras=True)
+        hints = type_hints(func)
         return_type = hints.get("return")
         if return_type is None:
             return False
@@ -144,12 +159,12 @@ class PydanticBackend:
         ``model_json_schema()``.  For ``list[Model]``, returns an
         array schema wrapping the model schema.
         """
-        hints = typing.get_type_hints(func, include_extras=True)
+        hints = type_hints(func)
         return_type = hints["return"]
 
         # Direct BaseModel subclass
         if isinstance(return_type, type) and issubclass(return_type, BaseModel):
-            return return_type.model_json_schema()
+            return _model_schema_copy(return_type)
 
         origin = get_origin(return_type)
         args = get_args(return_type)
@@ -160,14 +175,14 @@ class PydanticBackend:
                 if isinstance(arg, type) and issubclass(arg, BaseModel):
                     return {
                         "type": "array",
-                        "items": arg.model_json_schema(),
+                        "items": _model_schema_copy(arg),
                     }
 
         # Optional[Model] / Model | None -> model schema
         if origin is Union or isinstance(return_type, types.UnionType):
             for arg in args:
                 if isinstance(arg, type) and issubclass(arg, BaseModel):
-                    return arg.model_json_schema()
+                    return _model_schema_copy(arg)
 
         msg = f"Cannot infer output schema for return type: {return_type}"
         raise TypeError(msg)
@@ -26,13 +26,63 @@ import logging
 import types
 import typing
 import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Callable, Union
 
-from flask_apcore.schemas._constants import FLASK_TYPE_MAP
+from flask_apcore.schemas._constants import merge_url_params
+from flask_apcore.schemas._introspection import type_hints
 
 logger = logging.getLogger("flask_apcore")
 
 
+def _params_with_defaults(func: Callable) -> frozenset[str]:
+    """Return the names of func's parameters that have default values.
+
+    Plain functions are read straight from ``__code__``/``__defaults__``,
+    avoiding the cost of building an inspect.Signature. Wrapped functions
+    (``__wrapped__``) and other callables fall back to inspect.signature,
+    which follows the wrapper chain.
+    """
+    if isinstance(func, types.FunctionType) and not hasattr(func, "__wrapped__"):
+        code = func.__code__
+        positional = code.co_varnames[: code.co_argcount]
+        defaults = func.__defaults__ or ()
+        names = set(positional[len(positional) - len(defaults) :]) if defaults else set()
+        if func.__kwdefaults__:
+            names.update(func.__kwdefaults__)
+        return frozenset(names)
+
+    sig = inspect.signature(func)
+    return frozenset(name for name, param in sig.parameters.items() if param.default is not inspect.Parameter.empty)
+
+
+_NoneType = type(None)
+
+
+def _unwrap_optional(hint: Any) -> tuple[Any, bool]:
+    """Split ``Optional[T]`` / ``T | None`` into ``(T, True)``.
+
+    Any other hint, including unions with more than one non-None member,
+    is returned unchanged as ``(hint, False)``. Plain classes and PEP 604
+    unions are recognised from their type and ``__args__`` directly; only
+    ``typing`` special forms go through ``typing.get_origin``.
+    """
+    hint_cls = hint.__class__
+    if hint_cls is type:
+        return hint, False
+    if hint_cls is types.UnionType:
+        args = hint.__args__
+    elif typing.get_origin(hint) is Union:
+        args = typing.get_args(hint)
+    else:
+        return hint, False
+
+    if len(args) == 2 and _NoneType in args:
+        return (args[1] if args[0] is _NoneType else args[0]), True
+    return hint, False
+
+
 class TypeHintsBackend:
     """Python type hints to JSON Schema conversion.
 
@@ -40,21 +90,26 @@ class TypeHintsBackend:
     marshmallow backends can handle the function.
     """
 
-    _TYPE_MAP: dict[type, dict[str, Any]] = {
-        str: {"type": "string"},
-        int: {"type": "integer"},
-        float: {"type": "number"},
-        bool: {"type": "boolean"},
-        list: {"type": "array"},
-        dict: {"type": "object"},
-        datetime.datetime: {"type": "string", "format": "date-time"},
-        datetime.date: {"type": "string", "format": "date"},
-        uuid.UUID: {"type": "string", "format": "uuid"},
-    }
+    # Read-only so the shared table cannot be altered through a returned
+    # schema; _type_to_schema() hands out plain-dict copies, which stay
+    # YAML/JSON serializable.
+    _TYPE_MAP: Mapping[type, Mapping[str, Any]] = MappingProxyType(
+        {
+            str: MappingProxyType({"type": "string"}),
+            int: MappingProxyType({"type": "integer"}),
+            float: MappingProxyType({"type": "number"}),
+            bool: MappingProxyType({"type": "boolean"}),
+            list: MappingProxyType({"type": "array"}),
+            dict: MappingProxyType({"type": "object"}),
+            datetime.datetime: MappingProxyType({"type": "string", "format": "date-time"}),
+            datetime.date: MappingProxyType({"type": "string", "format": "date"}),
+            uuid.UUID: MappingProxyType({"type": "string", "format": "uuid"}),
+        }
+    )
 
     def can_handle_input(self, func: Callable, context: dict | None = None) -> bool:
         """Return True if function has any typed parameters (excluding return, self, cls)."""
-        hints = typing.get_type_hints(func, include_extras=True)
+        hints = type_hints(func)
         return any(name not in ("return", "self", "cls") for name in hints)
 
     def infer_input(
@@ -73,8 +128,8 @@ class TypeHintsBackend:
         Returns:
             JSON Schema dict for the function's input.
         """
-        hints = typing.get_type_hints(func, include_extras=True)
-        sig = inspect.signature(func)
+        hints = type_hints(func)
+        defaulted = _params_with_defaults(func)
 
         schema: dict[str, Any] = {
             "type": "object",
@@ -86,44 +141,28 @@ class TypeHintsBackend:
             if name in ("return", "self", "cls"):
                 continue
 
-            is_optional = False
-            resolved_hint = hint
-
-            # Check for Optional[T] or T | None
-            origin = typing.get_origin(hint)
-            if origin is Union or isinstance(hint, types.UnionType):
-                args = typing.get_args(hint)
-                non_none = [a for a in args if a is not type(None)]
-                if len(non_none) == 1 and type(None) in args:
-                    is_optional = True
-                    resolved_hint = non_none[0]
-
+            resolved_hint, is_optional = _unwrap_optional(hint)
             prop_schema = self._type_to_schema(resolved_hint)
             schema["properties"][name] = prop_schema
 
             # Determine if required (no default value and not Optional)
-            param = sig.parameters.get(name)
-            has_default = param is not None and param.default is not inspect.Parameter.empty
-            if not is_optional and not has_default:
+            if not is_optional and name not in defaulted:
                 schema["required"].append(name)
 
         # Merge URL params
         if url_params:
-            for param_name, param_type in url_params.items():
-                schema["properties"][param_name] = FLASK_TYPE_MAP.get(param_type, {"type": "string"})
-                if param_name not in schema["required"]:
-                    schema["required"].append(param_name)
+            merge_url_params(schema["properties"], schema["required"], url_params)
 
         return schema
 
     def can_handle_output(self, func: Callable, context: dict | None = None) -> bool:
         """Return True if function has a return type annotation."""
-        hints = typing.get_type_hints(func, include_extras=True)
+        hints = type_hints(func)
         return "return" in hints
 
     def infer_output(self, func: Callable, context: dict | None = None) -> dict[str, Any]:
         """Convert function return type hint to JSON Schema."""
-        hints = typing.get_type_hints(func, include_extras=True)
+        hints = type_hints(func)
         return_type = hints.get("return")
         if return_type is None:
             return {"type": "object", "properties": {}}
@@ -131,9 +170,10 @@ class TypeHintsBackend:
 
     def _type_to_schema(self, hint: Any) -> dict[str, Any]:
         """Convert a single Python type to a JSON Schema dict."""
-        # Direct type match
-        if hint in self._TYPE_MAP:
-            return dict(self._TYPE_MAP[hint])
+        # Direct type match (single table probe)
+        primitive = self._TYPE_MAP.get(hint)
+        if primitive is not None:
+            return dict(primitive)
 
         # Parameterized generics: list[str], dict[str, int], etc.
         origin = typing.get_origin(hint)
@@ -7,11 +7,18 @@ Blueprint to convert ScannedModule instances into dicts.
 from __future__ import annotations
 
 import dataclasses
-from typing import Any
+import functools
+from collections.abc import Hashable
+from typing import Any, cast
 
 from flask_apcore.scanners.base import ScannedModule
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_asdict(annotations: Any) -> dict[str, Any]:
+    return dataclasses.asdict(annotations)
+
+
 def annotations_to_dict(annotations: Any) -> dict[str, Any] | None:
     """Convert annotations to a plain dict, handling both dataclass and dict forms.
 
@@ -30,7 +37,14 @@ def annotations_to_dict(annotations: Any) -> dict[str, Any] | None:
     if isinstance(annotations, dict):
         return annotations
     if dataclasses.is_dataclass(annotations) and not isinstance(annotations, type):
-        return dataclasses.asdict(annotations)
+        # Scanners share a handful of frozen annotation instances across all
+        # modules, so the recursive asdict() walk is cached per value and a
+        # shallow copy (the fields are flat) handed out.
+        try:
+            return dict(_cached_asdict(cast(Hashable, annotations)))
+        except TypeError:
+            # Mutable (unhashable) dataclass: convert without caching.
+            return dataclasses.asdict(annotations)
     return None
 
 
@@ -38,7 +52,7 @@ def module_to_dict(module: ScannedModule) -> dict[str, Any]:
     """Convert a ScannedModule to a flat dict with all fields.
 
     The ``annotations`` field is converted to a plain dict via
-    ``dataclasses.asdict`` when present, or kept as ``None``.
+    annotations_to_dict() when present, or kept as ``None``.
 
     Args:
         module: A ScannedModule instance.
@@ -55,7 +69,7 @@ def module_to_dict(module: ScannedModule) -> dict[str, Any]:
         "tags": module.tags,
         "version": module.version,
         "target": module.target,
-        "annotations": (dataclasses.asdict(module.annotations) if module.annotations is not None else None),
+        "annotations": annotations_to_dict(module.annotations),
         "metadata": module.metadata,
         "input_schema": module.input_schema,
         "output_schema": module.output_schema,
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+# Import apcore and flask_apcore once at collection time so per-test imports
+# are plain sys.modules lookups.
+import apcore  # noqa: F401
 import pytest
+from apcore import Executor, ExtensionManager, ModuleAnnotations, Registry  # noqa: F401
 from flask import Flask
 
+import flask_apcore  # noqa: F401
+
 
 @pytest.fixture()
 def app(tmp_path):
@@ -30,3 +36,43 @@ def initialized_app(app):
 
     Apcore(app)
     return app
+
+
+@pytest.fixture(scope="module")
+def shared_memory_exporter():
+    """Reuse one InMemoryExporter for every tracing setup within a test module."""
+    from apcore.observability.tracing import InMemoryExporter
+
+    exporter = InMemoryExporter()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("apcore.observability.tracing.InMemoryExporter", lambda *args, **kwargs: exporter)
+        yield exporter
+    exporter.clear()
+
+
+@pytest.fixture(scope="session")
+def apcore_ext():
+    """Factory returning setup_observability() ext_data for APCORE_* overrides.
+
+    Results are cached per distinct set of overrides for the whole session,
+    so callers must treat the returned dict as read-only.
+    """
+    from flask_apcore.config import load_settings
+    from flask_apcore.observability import setup_observability
+
+    cache: dict[tuple, dict] = {}
+
+    def build(**overrides) -> dict:
+        key = tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in overrides.items()))
+        ext_data = cache.get(key)
+        if ext_data is None:
+            a = Flask(__name__)
+            a.config["TESTING"] = True
+            a.config["APCORE_AUTO_DISCOVER"] = False
+            a.config.update(overrides)
+            ext_data = {}
+            setup_observability(load_settings(a), ext_data)
+            cache[key] = ext_data
+        return ext_data
+
+    return build
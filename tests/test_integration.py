@@ -6,12 +6,15 @@ Tests the full flow: Flask app creation -> Apcore init -> scan -> register -> ve
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
+import pytest
 from flask import Flask
 
 from flask_apcore import Apcore
 
+pytestmark = pytest.mark.usefixtures("shared_memory_exporter")
+
 
 # ---------------------------------------------------------------------------
 # Module-level view functions (resolvable targets for RegistryWriter)
@@ -250,8 +253,7 @@ class TestObservabilityIntegration:
             # Verify tracing middleware is included
             from apcore.observability.tracing import TracingMiddleware
 
-            mw_types = [type(mw) for mw in executor.middlewares]
-            assert TracingMiddleware in mw_types
+            assert TracingMiddleware in {type(mw) for mw in executor.middlewares}
 
     def test_metrics_middleware_in_executor(self, tmp_path):
         app = Flask(__name__)
@@ -273,8 +275,7 @@ class TestObservabilityIntegration:
 
             from apcore.observability.metrics import MetricsMiddleware
 
-            mw_types = [type(mw) for mw in executor.middlewares]
-            assert MetricsMiddleware in mw_types
+            assert MetricsMiddleware in {type(mw) for mw in executor.middlewares}
 
     def test_all_observability_middlewares(self, tmp_path):
         app = Flask(__name__)
@@ -390,11 +391,18 @@ class TestContextIntegration:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture()
+def mock_do_serve(monkeypatch):
+    """Replace flask_apcore.cli._do_serve so 'apcore serve' never starts a server."""
+    mock = MagicMock()
+    monkeypatch.setattr("flask_apcore.cli._do_serve", mock)
+    return mock
+
+
 class TestFullPipeline:
     """Full pipeline: create app, init, scan, serve (mocked)."""
 
-    @patch("flask_apcore.cli._do_serve")
-    def test_scan_then_serve(self, mock_serve, tmp_path):
+    def test_scan_then_serve(self, mock_do_serve, tmp_path):
         app = Flask(__name__)
         app.config["APCORE_MODULE_DIR"] = str(tmp_path)
         app.config["APCORE_AUTO_DISCOVER"] = False
@@ -415,12 +423,11 @@ class TestFullPipeline:
         assert serve_result.exit_code == 0, serve_result.output
 
         # Verify _do_serve was called with the registry
-        mock_serve.assert_called_once()
-        call_kwargs = mock_serve.call_args
+        mock_do_serve.assert_called_once()
+        call_kwargs = mock_do_serve.call_args
         assert call_kwargs.kwargs["name"] == "apcore-mcp"
 
-    @patch("flask_apcore.cli._do_serve")
-    def test_scan_with_observability_then_serve(self, mock_serve, tmp_path):
+    def test_scan_with_observability_then_serve(self, mock_do_serve, tmp_path):
         """Full pipeline with observability enabled."""
         app = Flask(__name__)
         app.config["APCORE_MODULE_DIR"] = str(tmp_path)
@@ -441,12 +448,11 @@ class TestFullPipeline:
         serve_result = runner.invoke(args=["apcore", "serve"])
         assert serve_result.exit_code == 0, serve_result.output
 
-        call_kwargs = mock_serve.call_args
+        call_kwargs = mock_do_serve.call_args
         # metrics_collector should be passed
         assert call_kwargs.kwargs["metrics_collector"] is not None
 
-    @patch("flask_apcore.cli._do_serve")
-    def test_scan_with_jwt_then_serve(self, mock_serve, tmp_path):
+    def test_scan_with_jwt_then_serve(self, mock_do_serve, tmp_path):
         """Full pipeline with JWT authentication enabled."""
         app = Flask(__name__)
         app.config["APCORE_MODULE_DIR"] = str(tmp_path)
@@ -468,7 +474,7 @@ class TestFullPipeline:
         serve_result = runner.invoke(args=["apcore", "serve"])
         assert serve_result.exit_code == 0, serve_result.output
 
-        call_kwargs = mock_serve.call_args
+        call_kwargs = mock_do_serve.call_args
         # authenticator should be constructed from config
         assert call_kwargs.kwargs["authenticator"] is not None
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import apcore
 import pytest
 
 import flask_apcore
+from flask_apcore.extension import Apcore as ExtApcore
 
 
 # ---------------------------------------------------------------------------
@@ -65,56 +67,23 @@ class TestReExportedTypes:
     """Re-exported types are identical to apcore originals."""
 
     def test_apcore_class(self):
-        from flask_apcore.extension import Apcore as ExtApcore
-
+        # Apcore is the Flask extension, not re-exported from apcore
         assert flask_apcore.Apcore is ExtApcore
 
-    def test_module_decorator(self):
-        import apcore
-
-        assert flask_apcore.module is apcore.module
-
-    def test_registry(self):
-        import apcore
-
-        assert flask_apcore.Registry is apcore.Registry
-
-    def test_executor(self):
-        import apcore
-
-        assert flask_apcore.Executor is apcore.Executor
-
-    def test_context(self):
-        import apcore
-
-        assert flask_apcore.Context is apcore.Context
-
-    def test_identity(self):
-        import apcore
-
-        assert flask_apcore.Identity is apcore.Identity
-
-    def test_acl(self):
-        import apcore
-
-        assert flask_apcore.ACL is apcore.ACL
-
-    def test_config(self):
-        import apcore
-
-        assert flask_apcore.Config is apcore.Config
-
-    def test_middleware(self):
-        import apcore
-
-        assert flask_apcore.Middleware is apcore.Middleware
-
-    def test_module_annotations(self):
-        import apcore
-
-        assert flask_apcore.ModuleAnnotations is apcore.ModuleAnnotations
-
-    def test_module_descriptor(self):
-        import apcore
-
-        assert flask_apcore.ModuleDescriptor is apcore.ModuleDescriptor
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "module",
+            "Registry",
+            "Executor",
+            "Context",
+            "Identity",
+            "ACL",
+            "Config",
+            "Middleware",
+            "ModuleAnnotations",
+            "ModuleDescriptor",
+        ],
+    )
+    def test_reexport_is_apcore_original(self, name):
+        assert getattr(flask_apcore, name) is getattr(apcore, name)
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import pytest
+from apcore import Executor, Registry
 from flask import Flask
 
 from flask_apcore.config import load_settings
+from flask_apcore.context import FlaskContextFactory
+from flask_apcore.registry import get_context_factory, get_executor, get_registry
 
 
 # ---------------------------------------------------------------------------
@@ -25,8 +28,6 @@ def _make_app(**overrides) -> Flask:
 
 def _init_ext_data(app: Flask, **extra) -> dict:
     """Manually set up app.extensions['apcore'] for unit testing registry functions."""
-    from apcore import Registry
-
     settings = load_settings(app)
     registry = Registry()
     ext_data = {
@@ -51,8 +52,6 @@ class TestGetRegistry:
     """Tests for get_registry()."""
 
     def test_returns_registry(self) -> None:
-        from flask_apcore.registry import get_registry
-
         app = _make_app()
         ext_data = _init_ext_data(app)
         with app.app_context():
@@ -60,16 +59,12 @@ class TestGetRegistry:
         assert reg is ext_data["registry"]
 
     def test_with_explicit_app(self) -> None:
-        from flask_apcore.registry import get_registry
-
         app = _make_app()
         ext_data = _init_ext_data(app)
         reg = get_registry(app)
         assert reg is ext_data["registry"]
 
     def test_raises_when_not_initialized(self) -> None:
-        from flask_apcore.registry import get_registry
-
         app = _make_app()
         with app.app_context():
             with pytest.raises(RuntimeError, match="flask-apcore not initialized"):
@@ -85,19 +80,14 @@ class TestGetExecutor:
     """Tests for get_executor()."""
 
     def test_creates_executor_lazily(self) -> None:
-        from flask_apcore.registry import get_executor
-
         app = _make_app()
         _init_ext_data(app)
         with app.app_context():
             executor = get_executor()
-        from apcore import Executor
 
         assert isinstance(executor, Executor)
 
     def test_caches_on_second_call(self) -> None:
-        from flask_apcore.registry import get_executor
-
         app = _make_app()
         _init_ext_data(app)
         with app.app_context():
@@ -105,23 +95,14 @@ class TestGetExecutor:
             executor2 = get_executor()
         assert executor1 is executor2
 
-    def test_combines_user_and_obs_middlewares(self) -> None:
+    def test_combines_user_and_obs_middlewares(self, apcore_ext) -> None:
         """Executor should include both user middlewares and observability middlewares."""
-        from flask_apcore.registry import get_executor
-
-        app = _make_app(
-            APCORE_TRACING_ENABLED=True,
-            APCORE_METRICS_ENABLED=True,
-        )
+        overrides = {"APCORE_TRACING_ENABLED": True, "APCORE_METRICS_ENABLED": True}
+        app = _make_app(**overrides)
         settings = load_settings(app)
 
-        # Create observability middlewares
-        from flask_apcore.observability import setup_observability
-
-        ext_data_partial: dict = {}
-        setup_observability(settings, ext_data_partial)
-
-        from apcore import Registry
+        # Observability middlewares (shared, read-only)
+        ext_data_partial = apcore_ext(**overrides)
 
         registry = Registry()
         ext_data = {
@@ -139,8 +120,6 @@ class TestGetExecutor:
             assert len(executor.middlewares) >= 2
 
     def test_raises_when_not_initialized(self) -> None:
-        from flask_apcore.registry import get_executor
-
         app = _make_app()
         with app.app_context():
             with pytest.raises(RuntimeError, match="flask-apcore not initialized"):
@@ -156,9 +135,6 @@ class TestGetContextFactory:
     """Tests for get_context_factory()."""
 
     def test_returns_flask_context_factory_by_default(self) -> None:
-        from flask_apcore.registry import get_context_factory
-        from flask_apcore.context import FlaskContextFactory
-
         app = _make_app()
         _init_ext_data(app)
         with app.app_context():
@@ -166,21 +142,16 @@ class TestGetContextFactory:
         assert isinstance(factory, FlaskContextFactory)
 
     def test_resolves_custom_dotted_path(self) -> None:
-        from flask_apcore.registry import get_context_factory
-
         app = _make_app(
             APCORE_CONTEXT_FACTORY="flask_apcore.context.FlaskContextFactory",
         )
         _init_ext_data(app)
         with app.app_context():
             factory = get_context_factory()
-        from flask_apcore.context import FlaskContextFactory
 
         assert isinstance(factory, FlaskContextFactory)
 
     def test_raises_when_not_initialized(self) -> None:
-        from flask_apcore.registry import get_context_factory
-
         app = _make_app()
         with app.app_context():
             with pytest.raises(RuntimeError, match="flask-apcore not initialized"):
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 
 import pytest
-from apcore import ModuleAnnotations, Registry
+from apcore import Context, ModuleAnnotations, Registry
 
 from flask_apcore.output.registry_writer import (
     RegistryWriter,
@@ -253,8 +253,6 @@ class TestFlattenPydanticParams:
         writer.write([mod], registry)
 
         fm = registry.get("create_item.post")
-        from apcore import Context
-
         result = fm.execute({"title": "Test", "description": "Desc", "done": True}, Context.create())
         assert result["id"] == 1
         assert result["title"] == "Test"
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
 from apcore import ModuleAnnotations
 
-from flask_apcore.scanners.base import BaseScanner, ScannedModule
+from flask_apcore.scanners.base import BaseScanner, ScannedModule, _compile_pattern, _literal_prefix
 
 
 # ---------------------------------------------------------------------------
@@ -117,6 +119,19 @@ class TestScannedModuleCreation:
         assert m.documentation == "Delete a user permanently."
         assert m.metadata["risk"] == "high"
 
+    def test_slotted_instances(self):
+        m = _make_module()
+        assert not hasattr(m, "__dict__")
+
+    def test_asdict_has_only_public_fields(self):
+        assert all(not name.startswith("_") for name in dataclasses.asdict(_make_module()))
+
+    def test_frozen_instances(self):
+        m = _make_module()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            m.module_id = "other.get"  # type: ignore[misc]
+        assert dataclasses.replace(m, module_id="other.get").module_id == "other.get"
+
 
 # ---------------------------------------------------------------------------
 # filter_modules
@@ -164,6 +179,45 @@ class TestFilterModules:
         result = self.scanner.filter_modules(self.modules, exclude=r".*")
         assert result == []
 
+    def test_accepts_generator_input(self):
+        result = self.scanner.filter_modules((m for m in self.modules), include=r"^items\.")
+        assert [m.module_id for m in result] == ["items.list.get", "items.detail.get"]
+
+    def test_generator_input_without_filters_returns_list(self):
+        result = self.scanner.filter_modules(m for m in self.modules)
+        assert result == self.modules
+
+    def test_compiled_patterns_reused_across_calls(self):
+        _compile_pattern.cache_clear()
+        self.scanner.filter_modules(self.modules, include=r"^users\.\w+")
+        self.scanner.filter_modules(self.modules, include=r"^users\.\w+")
+        info = _compile_pattern.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_anchored_literal_prefix_skips_regex(self):
+        _compile_pattern.cache_clear()
+        result = self.scanner.filter_modules(self.modules, exclude=r"^users\.")
+        assert [m.module_id for m in result] == ["items.list.get", "items.detail.get", "admin.dashboard.get"]
+        assert _compile_pattern.cache_info().misses == 0
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            (r"^users\.", "users."),
+            (r"^apcore_explorer\.", "apcore_explorer."),
+            ("^", ""),
+            (r"users\.", None),
+            (r"^users\.\w+", None),
+            (r"^users\d", None),
+            (r"^(?i)users", None),
+            ("^users$", None),
+            ("^users\\", None),
+        ],
+    )
+    def test_literal_prefix_detection(self, pattern, expected):
+        assert _literal_prefix(pattern) == expected
+
 
 # ---------------------------------------------------------------------------
 # _deduplicate_ids
@@ -211,6 +265,18 @@ class TestDeduplicateIds:
         assert result[1].description == "second"
         assert result[1].module_id == "a.get_2"
 
+    def test_suffix_skips_existing_id(self):
+        modules = [
+            _make_module(module_id="a.get"),
+            _make_module(module_id="a.get_2"),
+            _make_module(module_id="a.get"),
+            _make_module(module_id="a.get_2"),
+        ]
+        result = self.scanner._deduplicate_ids(modules)
+        ids = [m.module_id for m in result]
+        assert ids == ["a.get", "a.get_2", "a.get_3", "a.get_2_2"]
+        assert len(set(ids)) == len(ids)
+
 
 # ---------------------------------------------------------------------------
 # _is_api_route
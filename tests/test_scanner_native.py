@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+import copy
+import dataclasses
+import gc
+import pickle
+import weakref
+from dataclasses import dataclass
+
 import pytest
 from flask import Blueprint, Flask
 
@@ -14,9 +21,13 @@ from flask_apcore.scanners.native import NativeFlaskScanner
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def app():
-    """Minimal Flask app with a few routes for scanner testing."""
+    """Minimal Flask app with a few routes for scanner testing.
+
+    Module-scoped: scanning only reads the URL map, so every test can share
+    one app.
+    """
     app = Flask(__name__)
     app.config["TESTING"] = True
 
@@ -58,9 +69,9 @@ def app():
     return app
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def bp_app():
-    """Flask app with Blueprint routes."""
+    """Flask app with Blueprint routes (module-scoped, read-only)."""
     app = Flask(__name__)
     app.config["TESTING"] = True
 
@@ -165,6 +176,41 @@ class TestDocumentation:
         assert "GET" in m.description or "/no-doc" in m.description
         assert m.documentation is None
 
+    def test_unhashable_view_callable(self, scanner):
+        @dataclass
+        class View:
+            """Callable view object."""
+
+            name: str = "v"
+
+            def __call__(self) -> dict:
+                return {}
+
+        view = View()
+        view.__name__ = "v"
+        app = Flask(__name__)
+        app.add_url_rule("/v", "v", view)
+        with app.app_context():
+            modules = scanner.scan(app)
+        assert [m.module_id for m in modules] == ["v.get"]
+        assert modules[0].description == "Callable view object."
+
+    def test_docstring_cache_does_not_outlive_scanner(self):
+        app = Flask(__name__)
+
+        @app.route("/tmp")
+        def tmp_view():
+            """Temporary view."""
+            return ""
+
+        ref = weakref.ref(tmp_view)
+        scanner = NativeFlaskScanner()
+        with app.app_context():
+            scanner.scan(app)
+        del app, tmp_view, scanner
+        gc.collect()
+        assert ref() is None
+
 
 # ---------------------------------------------------------------------------
 # Metadata
@@ -180,6 +226,13 @@ class TestMetadata:
         for m in modules:
             assert m.metadata.get("source") == "native"
 
+    def test_modules_copyable_and_picklable(self, app, scanner):
+        with app.app_context():
+            module = scanner.scan(app, include=r"list_items\.get$")[0]
+        assert dataclasses.asdict(module)["metadata"] == {"source": "native"}
+        assert copy.deepcopy(module) == module
+        assert pickle.loads(pickle.dumps(module)) == module
+
 
 # ---------------------------------------------------------------------------
 # URL parameter extraction and typing
@@ -257,6 +310,24 @@ class TestStaticRouteSkipping:
         assert not any("static" in mid for mid in ids)
 
 
+class TestSchemaIsolation:
+    """Modules built from the same view must not share schema objects."""
+
+    def test_methods_on_one_view_get_separate_schemas(self, scanner):
+        app = Flask(__name__)
+
+        @app.route("/things", methods=["GET", "POST"])
+        def things(name: str) -> dict:
+            return {}
+
+        with app.app_context():
+            modules = {m.http_method: m for m in scanner.scan(app)}
+
+        assert modules["GET"].input_schema == modules["POST"].input_schema
+        assert modules["GET"].input_schema is not modules["POST"].input_schema
+        assert modules["GET"].output_schema is not modules["POST"].output_schema
+
+
 # ---------------------------------------------------------------------------
 # Deduplication
 # ---------------------------------------------------------------------------
@@ -286,6 +357,49 @@ class TestDeduplication:
         assert len(ids) == len(set(ids))
 
 
+# ---------------------------------------------------------------------------
+# Filtering
+# ---------------------------------------------------------------------------
+
+
+class TestFiltering:
+    """Test include/exclude filtering inside scan()."""
+
+    def test_excluded_routes_skip_schema_inference(self, app, scanner):
+        inferred: list[str] = []
+        original = scanner._schema_dispatcher.infer_input_schema
+
+        def _spy(func, url_params=None, extra_context=None):
+            inferred.append(func.__name__)
+            return original(func, url_params=url_params, extra_context=extra_context)
+
+        scanner._schema_dispatcher.infer_input_schema = _spy
+        with app.app_context():
+            modules = scanner.scan(app, include=r"list_items\.get$")
+
+        assert [m.module_id for m in modules] == ["list_items.get"]
+        assert inferred == ["list_items"]
+
+    def test_filter_sees_deduplicated_ids(self):
+        """Suffixes are assigned before filtering, so they are stable."""
+        app = Flask(__name__)
+
+        @app.route("/a", methods=["GET"], endpoint="dup-x")
+        def first():
+            return ""
+
+        @app.route("/b", methods=["GET"], endpoint="dup_x")
+        def second():
+            return ""
+
+        scanner = NativeFlaskScanner()
+        with app.app_context():
+            modules = scanner.scan(app, include=r"_2$")
+
+        assert [m.module_id for m in modules] == ["dup_x.get_2"]
+        assert modules[0].url_rule == "/b"
+
+
 # ---------------------------------------------------------------------------
 # Scanner registry / factory
 # ---------------------------------------------------------------------------
@@ -306,3 +420,9 @@ class TestScannerRegistry:
         app = Flask(__name__)
         scanner = auto_detect_scanner(app)
         assert isinstance(scanner, NativeFlaskScanner)
+
+    def test_scanner_instances_not_shared(self):
+        """Each call gets its own scanner, so schema caches die with it."""
+        app = Flask(__name__)
+        assert get_scanner("native") is not get_scanner("native")
+        assert auto_detect_scanner(app) is not auto_detect_scanner(app)
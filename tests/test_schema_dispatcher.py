@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 
 from pydantic import BaseModel
 
@@ -33,6 +34,16 @@ def _no_hints_func():
     pass
 
 
+@dataclass
+class _UnhashableView:
+    """Callable dataclass instance; eq=True makes it unhashable."""
+
+    greeting: str = "hi"
+
+    def __call__(self, name: str) -> dict:
+        return {}
+
+
 # ---------------------------------------------------------------------------
 # SchemaDispatcher
 # ---------------------------------------------------------------------------
@@ -44,6 +55,13 @@ class TestSchemaDispatcher:
     def setup_method(self):
         self.dispatcher = SchemaDispatcher()
 
+    def test_backends_created_lazily(self):
+        """Backends are only instantiated on first use."""
+        dispatcher = SchemaDispatcher()
+        assert dispatcher._backend_list is None
+        dispatcher.infer_output_schema(_plain_func)
+        assert dispatcher._backend_list is not None
+
     def test_backends_registered(self):
         """At least Pydantic and TypeHints backends are registered."""
         assert len(self.dispatcher._backends) >= 2
@@ -98,6 +116,102 @@ class TestSchemaDispatcher:
         assert "item_id" in schema.get("properties", {})
         assert schema["properties"]["item_id"]["type"] == "integer"
 
+    def _count_inference(self, method: str) -> list[str]:
+        """Wrap every backend's *method* and record the functions it infers."""
+        calls: list[str] = []
+        for backend in self.dispatcher._backends:
+            original = getattr(backend, method)
+
+            def _spy(func, *args, _original=original, **kwargs):
+                calls.append(func.__name__)
+                return _original(func, *args, **kwargs)
+
+            setattr(backend, method, _spy)
+        return calls
+
+    def test_repeated_inference_hits_cache(self):
+        """Identical calls run the backend once and return equal copies."""
+        input_calls = self._count_inference("infer_input")
+        output_calls = self._count_inference("infer_output")
+
+        first = self.dispatcher.infer_input_schema(_plain_func, url_params={"item_id": "int"})
+        second = self.dispatcher.infer_input_schema(_plain_func, url_params={"item_id": "int"})
+        assert first == second
+        assert first is not second
+        assert input_calls == ["_plain_func"]
+
+        assert self.dispatcher.infer_output_schema(_plain_func) == self.dispatcher.infer_output_schema(_plain_func)
+        assert output_calls == ["_plain_func"]
+
+    def test_mutating_result_does_not_touch_cache(self):
+        """Returned schemas are independent of the cached one."""
+        first = self.dispatcher.infer_input_schema(_pydantic_func)
+        first["properties"]["name"]["injected"] = True
+        first["required"].append("injected")
+
+        second = self.dispatcher.infer_input_schema(_pydantic_func)
+        assert "injected" not in second["properties"]["name"]
+        assert "injected" not in second["required"]
+
+    def test_cache_keyed_on_url_params(self):
+        """Different URL params produce distinct cache entries."""
+        with_param = self.dispatcher.infer_input_schema(_plain_func, url_params={"item_id": "int"})
+        without = self.dispatcher.infer_input_schema(_plain_func)
+        assert "item_id" in with_param["properties"]
+        assert "item_id" not in without["properties"]
+
+    def test_extra_context_bypasses_cache(self):
+        """Calls with extra_context are never memoized."""
+        first = self.dispatcher.infer_input_schema(_plain_func, extra_context={})
+        second = self.dispatcher.infer_input_schema(_plain_func, extra_context={})
+        assert first == second
+        assert first is not second
+
+    def test_backend_selection_reused_across_url_params(self):
+        """can_handle_input runs once per function, not once per url_params."""
+        calls: list[str] = []
+        for backend in self.dispatcher._backends:
+            original = backend.can_handle_input
+
+            def _probe(func, context=None, _original=original):
+                calls.append(func.__name__)
+                return _original(func, context=context)
+
+            backend.can_handle_input = _probe
+
+        self.dispatcher.infer_input_schema(_plain_func, url_params={"a": "int"})
+        probes = len(calls)
+        self.dispatcher.infer_input_schema(_plain_func, url_params={"b": "int"})
+        assert probes > 0
+        assert len(calls) == probes
+
+    def test_priority_unaffected_by_selection_history(self):
+        """Many type-hint selections never demote the Pydantic backend."""
+        for _ in range(50):
+            self.dispatcher.clear_cache()
+            self.dispatcher.infer_input_schema(_plain_func)
+        schema = self.dispatcher.infer_input_schema(_pydantic_func)
+        assert set(schema["properties"]) == {"name", "age"}
+
+    def test_unhashable_callable_skips_cache(self):
+        """Unhashable view callables are inferred without memoization."""
+        view = _UnhashableView()
+        first = self.dispatcher.infer_input_schema(view, url_params={"item_id": "int"})
+        second = self.dispatcher.infer_input_schema(view, url_params={"item_id": "int"})
+        assert first == second
+        assert "item_id" in first["properties"]
+        assert self.dispatcher.infer_output_schema(view) == {"type": "object", "properties": {}}
+        assert not self.dispatcher._input_cache
+        assert not self.dispatcher._output_cache
+
+    def test_clear_cache(self):
+        """clear_cache() forces re-inference."""
+        calls = self._count_inference("infer_output")
+        self.dispatcher.infer_output_schema(_plain_func)
+        self.dispatcher.clear_cache()
+        self.dispatcher.infer_output_schema(_plain_func)
+        assert calls == ["_plain_func", "_plain_func"]
+
 
 class TestSchemaBackendProtocol:
     """Test SchemaBackend as a runtime checkable Protocol."""
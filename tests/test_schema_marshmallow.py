@@ -147,6 +147,28 @@ class TestInferInput:
         schema = self.backend.infer_input(_dummy_func, context=ctx)
         assert "name" in schema["properties"]
 
+    def test_conversion_cached_per_schema(self):
+        instance = UserSchema()
+        first = self.backend._schema_to_json_schema(instance)
+        assert self.backend._schema_to_json_schema(instance) is first
+
+    def test_url_params_do_not_leak_into_cache(self):
+        ctx = {"marshmallow_input": UserSchema()}
+        self.backend.infer_input(_dummy_func, url_params={"user_id": "int"}, context=ctx)
+        schema = self.backend.infer_input(_dummy_func, context=ctx)
+        assert "user_id" not in schema["properties"]
+        assert "user_id" not in schema["required"]
+
+    def test_mutating_result_does_not_leak_into_cache(self):
+        ctx = {"marshmallow_input": UserSchema()}
+        first = self.backend.infer_input(_dummy_func, context=ctx)
+        first["required"].append("injected")
+        next(iter(first["properties"].values()))["injected"] = True
+
+        second = self.backend.infer_input(_dummy_func, context=ctx)
+        assert "injected" not in second["required"]
+        assert all("injected" not in prop for prop in second["properties"].values())
+
 
 class TestInferOutput:
     def setup_method(self):
@@ -240,3 +262,15 @@ class TestFieldTypes:
         color_prop = schema["properties"]["color"]
         assert color_prop["type"] == "string"
         assert set(color_prop["enum"]) == {"red", "green", "blue"}
+
+    def test_field_subclass_resolved_through_mro(self):
+        class SlugField(fields.Email):
+            pass
+
+        class SlugSchema(Schema):
+            slug = SlugField()
+
+        ctx = {"marshmallow_input": SlugSchema()}
+        schema = self.backend.infer_input(_dummy_func, context=ctx)
+        assert schema["properties"]["slug"] == {"type": "string", "format": "email"}
+        assert SlugField in self.backend._field_handlers
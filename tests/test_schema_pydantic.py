@@ -154,3 +154,15 @@ class TestInferOutput:
         schema = self.backend.infer_output(pydantic_list_return)
         assert schema["type"] == "array"
         assert "name" in schema["items"].get("properties", {})
+
+    def test_mutating_result_does_not_leak(self):
+        """Results are private copies of the cached model schema."""
+        listed = self.backend.infer_output(pydantic_list_return)
+        listed["items"]["properties"]["injected"] = {"type": "string"}
+
+        direct = self.backend.infer_output(pydantic_return)
+        direct["properties"]["name"]["injected"] = True
+
+        assert "injected" not in self.backend.infer_output(pydantic_list_return)["items"]["properties"]
+        assert "injected" not in self.backend.infer_output(pydantic_return)["properties"]["name"]
+        assert "injected" not in self.backend.infer_input(pydantic_input)["properties"]["name"]
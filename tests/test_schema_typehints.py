@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import gc
+import typing
 import uuid
+import weakref
 
 
-from flask_apcore.schemas.typehints_backend import TypeHintsBackend
+from flask_apcore.schemas._constants import FLASK_TYPE_MAP
+from flask_apcore.schemas._introspection import type_hints
+from flask_apcore.schemas.typehints_backend import TypeHintsBackend, _unwrap_optional
 
 
 # ---------------------------------------------------------------------------
@@ -62,6 +68,23 @@ def default_param(x: int = 42) -> int:
     return x
 
 
+def kwonly_default(a: int, *, b: int = 1, c: str) -> int:
+    return a
+
+
+def _passthrough(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@_passthrough
+def wrapped_default(x: int, y: int = 0) -> int:
+    return x
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -132,12 +155,33 @@ class TestInferInput:
         schema = self.backend.infer_input(default_param)
         assert "x" not in schema["required"]
 
+    def test_kwonly_default_not_required(self):
+        schema = self.backend.infer_input(kwonly_default)
+        assert schema["required"] == ["a", "c"]
+
+    def test_wrapped_function_defaults_followed(self):
+        schema = self.backend.infer_input(wrapped_default)
+        assert schema["required"] == ["x"]
+
     def test_url_params_merged(self):
         schema = self.backend.infer_input(basic_func, url_params={"item_id": "int"})
         assert "item_id" in schema["properties"]
         assert schema["properties"]["item_id"]["type"] == "integer"
         assert "item_id" in schema["required"]
 
+    def test_url_param_schema_not_shared_with_type_table(self):
+        schema = self.backend.infer_input(basic_func, url_params={"item_id": "uuid"})
+        schema["properties"]["item_id"]["description"] = "mutated"
+        assert "description" not in FLASK_TYPE_MAP["uuid"]
+
+    def test_url_params_not_duplicated_in_required(self):
+        schema = self.backend.infer_input(basic_func, url_params={"name": "string", "item_id": "int"})
+        assert schema["required"] == ["name", "count", "active", "item_id"]
+
+    def test_unknown_url_param_type_is_string(self):
+        schema = self.backend.infer_input(basic_func, url_params={"slug": "custom"})
+        assert schema["properties"]["slug"] == {"type": "string"}
+
 
 class TestCanHandleOutput:
     def setup_method(self):
@@ -178,3 +222,46 @@ class TestInferOutput:
     def test_no_return_type(self):
         schema = self.backend.infer_output(no_hints_func)
         assert schema == {"type": "object", "properties": {}}
+
+
+class TestTypeHintsCache:
+    def test_hints_resolved_once_per_function(self):
+        assert type_hints(basic_func) is type_hints(basic_func)
+
+    def test_unhashable_callable_not_cached(self):
+        class _Unhashable:
+            __hash__ = None
+
+            def __call__(self, x: int) -> int:
+                return x
+
+        assert type_hints(_Unhashable().__call__) == {"x": int, "return": int}
+
+    def test_cache_does_not_keep_function_alive(self):
+        def _temp(x: int) -> int:
+            return x
+
+        type_hints(_temp)
+        ref = weakref.ref(_temp)
+        del _temp
+        gc.collect()
+        assert ref() is None
+
+
+class TestUnwrapOptional:
+    def test_plain_type(self):
+        assert _unwrap_optional(int) == (int, False)
+
+    def test_pep604_optional(self):
+        assert _unwrap_optional(int | None) == (int, True)
+        assert _unwrap_optional(None | int) == (int, True)
+
+    def test_typing_optional(self):
+        assert _unwrap_optional(typing.Optional[str]) == (str, True)
+
+    def test_multi_member_union_unchanged(self):
+        hint = int | str | None
+        assert _unwrap_optional(hint) == (hint, False)
+
+    def test_generic_unchanged(self):
+        assert _unwrap_optional(list[int]) == (list[int], False)
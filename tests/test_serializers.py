@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import Any
 
 from apcore import ModuleAnnotations
@@ -66,6 +67,14 @@ class TestModuleToDict:
         d = module_to_dict(mod)
         assert d["annotations"] is None
 
+    def test_schemas_shared_not_copied(self):
+        from flask_apcore.serializers import module_to_dict
+
+        mod = _make_module()
+        d = module_to_dict(mod)
+        assert d["input_schema"] is mod.input_schema
+        assert d["output_schema"] is mod.output_schema
+
 
 class TestModulesToDicts:
     def test_batch_conversion(self):
@@ -81,3 +90,26 @@ class TestModulesToDicts:
         from flask_apcore.serializers import modules_to_dicts
 
         assert modules_to_dicts([]) == []
+
+
+class TestAnnotationsToDict:
+    def test_frozen_annotations_converted_once(self):
+        from flask_apcore.serializers import _cached_asdict, annotations_to_dict
+
+        ann = ModuleAnnotations(destructive=True)
+        first = annotations_to_dict(ann)
+        hits = _cached_asdict.cache_info().hits
+        second = annotations_to_dict(ann)
+
+        assert first == second == dataclasses.asdict(ann)
+        assert first is not second
+        assert _cached_asdict.cache_info().hits == hits + 1
+
+    def test_unhashable_dataclass_not_cached(self):
+        from flask_apcore.serializers import annotations_to_dict
+
+        @dataclasses.dataclass
+        class _Mutable:
+            flag: bool = False
+
+        assert annotations_to_dict(_Mutable(flag=True)) == {"flag": True}
@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import uuid
+from pathlib import Path
 from typing import Any
 
 import pytest
 import yaml
 from apcore import ModuleAnnotations
+from flask import Flask
+from pydantic import BaseModel
 
 from flask_apcore.output import get_writer
 from flask_apcore.output.registry_writer import RegistryWriter
 from flask_apcore.output.yaml_writer import YAMLWriter
 from flask_apcore.scanners.base import ScannedModule
+from flask_apcore.scanners.native import NativeFlaskScanner
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 
 # ---------------------------------------------------------------------------
@@ -45,6 +55,37 @@ def _make_module(
     return ScannedModule(**defaults)
 
 
+class _Item(BaseModel):
+    title: str
+    done: bool = False
+
+
+def _update_item(item_id: int, body: _Item) -> _Item:
+    """Update an item."""
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def yaml_root(tmp_path_factory) -> Path:
+    """One temporary directory shared by every test in this module."""
+    return tmp_path_factory.mktemp("yaml_writer")
+
+
+@pytest.fixture()
+def out_dir(yaml_root) -> Path:
+    """Per-test output path under yaml_root.
+
+    Not created here: YAMLWriter.write() creates it on first write, so
+    dry-run and empty-input tests never touch the filesystem.
+    """
+    return yaml_root / uuid.uuid4().hex
+
+
 # ---------------------------------------------------------------------------
 # YAMLWriter tests
 # ---------------------------------------------------------------------------
@@ -53,21 +94,31 @@ def _make_module(
 class TestYAMLWriter:
     """Test YAMLWriter generates correct .binding.yaml files."""
 
-    def test_generates_yaml_file(self, tmp_path):
+    @pytest.mark.parametrize(
+        "module_ids, dry_run, expect_files",
+        [
+            (["test.get"], False, 1),
+            (["a.get", "b.post"], False, 2),
+            (["test.get"], True, 0),
+            ([], False, 0),
+        ],
+        ids=["single", "multiple", "dry_run", "empty"],
+    )
+    def test_write_file_count(self, out_dir, module_ids, dry_run, expect_files):
         writer = YAMLWriter()
-        modules = [_make_module()]
+        modules = [_make_module(module_id=mid) for mid in module_ids]
 
-        results = writer.write(modules, str(tmp_path))
+        results = writer.write(modules, str(out_dir), dry_run=dry_run)
 
-        assert len(results) == 1
-        files = list(tmp_path.glob("*.binding.yaml"))
-        assert len(files) == 1
+        assert len(results) == len(module_ids)
+        files = list(out_dir.glob("*.binding.yaml"))
+        assert len(files) == expect_files
 
-    def test_yaml_content_structure(self, tmp_path):
+    def test_yaml_content_structure(self, out_dir):
         writer = YAMLWriter()
         modules = [_make_module()]
 
-        results = writer.write(modules, str(tmp_path))
+        results = writer.write(modules, str(out_dir))
 
         binding = results[0]
         assert "bindings" in binding
@@ -77,82 +128,67 @@ class TestYAMLWriter:
         assert entry["target"] == "myapp.views:get_items"
         assert entry["description"] == "Test endpoint"
 
-    def test_yaml_includes_annotations(self, tmp_path):
+    def test_yaml_includes_annotations(self, out_dir):
         writer = YAMLWriter()
         ann = ModuleAnnotations(readonly=True, destructive=False)
         modules = [_make_module(annotations=ann)]
 
-        results = writer.write(modules, str(tmp_path))
+        results = writer.write(modules, str(out_dir))
 
         entry = results[0]["bindings"][0]
         assert "annotations" in entry
         assert entry["annotations"]["readonly"] is True
         assert entry["annotations"]["destructive"] is False
 
-    def test_yaml_annotations_none(self, tmp_path):
+    def test_yaml_annotations_none(self, out_dir):
         writer = YAMLWriter()
         modules = [_make_module(annotations=None)]
 
-        results = writer.write(modules, str(tmp_path))
+        results = writer.write(modules, str(out_dir))
 
         entry = results[0]["bindings"][0]
         # When annotations is None, it should not be in the output
         # or should be None
         assert entry.get("annotations") is None
 
-    def test_yaml_includes_documentation(self, tmp_path):
+    def test_yaml_includes_documentation(self, out_dir):
         writer = YAMLWriter()
         modules = [_make_module(documentation="Full documentation text.")]
 
-        results = writer.write(modules, str(tmp_path))
+        results = writer.write(modules, str(out_dir))
 
         entry = results[0]["bindings"][0]
         assert entry["documentation"] == "Full documentation text."
 
-    def test_yaml_documentation_none(self, tmp_path):
+    def test_yaml_documentation_none(self, out_dir):
         writer = YAMLWriter()
         modules = [_make_module(documentation=None)]
 
-        results = writer.write(modules, str(tmp_path))
+        results = writer.write(modules, str(out_dir))
 
         entry = results[0]["bindings"][0]
         assert entry.get("documentation") is None
 
-    def test_yaml_includes_metadata(self, tmp_path):
+    def test_yaml_includes_metadata(self, out_dir):
         writer = YAMLWriter()
         modules = [_make_module(metadata={"source": "native", "extra": "data"})]
 
-        results = writer.write(modules, str(tmp_path))
+        results = writer.write(modules, str(out_dir))
 
         entry = results[0]["bindings"][0]
         assert entry["metadata"]["source"] == "native"
         assert entry["metadata"]["extra"] == "data"
 
-    def test_yaml_metadata_empty(self, tmp_path):
+    def test_yaml_metadata_empty(self, out_dir):
         writer = YAMLWriter()
         modules = [_make_module(metadata={})]
 
-        results = writer.write(modules, str(tmp_path))
+        results = writer.write(modules, str(out_dir))
 
         entry = results[0]["bindings"][0]
         assert entry["metadata"] == {}
 
-    def test_dry_run_does_not_write(self, tmp_path):
-        writer = YAMLWriter()
-        modules = [_make_module()]
-
-        results = writer.write(modules, str(tmp_path), dry_run=True)
-
-        assert len(results) == 1
-        files = list(tmp_path.glob("*.binding.yaml"))
-        assert len(files) == 0
-
-    def test_empty_modules_returns_empty(self, tmp_path):
-        writer = YAMLWriter()
-        results = writer.write([], str(tmp_path))
-        assert results == []
-
-    def test_written_yaml_is_parseable(self, tmp_path):
+    def test_written_yaml_is_parseable(self, out_dir):
         writer = YAMLWriter()
         ann = ModuleAnnotations(readonly=True)
         modules = [
@@ -163,27 +199,53 @@ class TestYAMLWriter:
             )
         ]
 
-        writer.write(modules, str(tmp_path))
+        writer.write(modules, str(out_dir))
 
-        files = list(tmp_path.glob("*.binding.yaml"))
+        files = list(out_dir.glob("*.binding.yaml"))
         content = files[0].read_text()
-        parsed = yaml.safe_load(content)
+        parsed = yaml.load(content, Loader=_SafeLoader)
         assert parsed["bindings"][0]["annotations"]["readonly"] is True
         assert parsed["bindings"][0]["documentation"] == "Docs here."
         assert parsed["bindings"][0]["metadata"]["source"] == "native"
 
-    def test_multiple_modules_create_multiple_files(self, tmp_path):
-        writer = YAMLWriter()
-        modules = [
-            _make_module(module_id="a.get"),
-            _make_module(module_id="b.post"),
-        ]
+    def test_non_ascii_round_trips(self, out_dir):
+        YAMLWriter().write([_make_module(description="Liste des éléments ✓")], str(out_dir))
+
+        content = next(out_dir.glob("*.binding.yaml")).read_text(encoding="utf-8")
+        parsed = yaml.load(content, Loader=_SafeLoader)
+        assert parsed["bindings"][0]["description"] == "Liste des éléments ✓"
+
+    def test_no_yaml_aliases_for_shared_model(self, out_dir):
+        """A model used as both body and return type is written out in full twice."""
+        app = Flask(__name__)
+        app.add_url_rule("/items/<int:item_id>", "update_item", _update_item, methods=["PUT"])
+        with app.app_context():
+            modules = NativeFlaskScanner().scan(app)
+
+        YAMLWriter().write(modules, str(out_dir))
+
+        content = (out_dir / "update_item.put.binding.yaml").read_text(encoding="utf-8")
+        assert "&id" not in content
+        assert "*id" not in content
+
+    def test_shared_schema_objects_not_aliased(self, out_dir):
+        schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+        YAMLWriter().write([_make_module(input_schema=schema, output_schema=schema)], str(out_dir))
+
+        content = next(out_dir.glob("*.binding.yaml")).read_text(encoding="utf-8")
+        assert "&id" not in content
+        parsed = yaml.load(content, Loader=_SafeLoader)
+        assert parsed["bindings"][0]["output_schema"] == schema
+
+    def test_dry_run_skips_serialization(self, out_dir, monkeypatch):
+        def _fail(*args, **kwargs):
+            raise AssertionError("yaml.dump called during dry run")
 
-        results = writer.write(modules, str(tmp_path))
+        monkeypatch.setattr(yaml, "dump", _fail)
+        results = YAMLWriter().write([_make_module()], str(out_dir), dry_run=True)
 
-        assert len(results) == 2
-        files = list(tmp_path.glob("*.binding.yaml"))
-        assert len(files) == 2
+        assert results[0]["bindings"][0]["module_id"] == "test.get"
+        assert not out_dir.exists()
 
 
 # ---------------------------------------------------------------------------